@@ -10,7 +10,11 @@ import math
 import logging
 import sys
 import os
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+import numpy as np
+
+from utils_numba import line_points, spiral_points, circle_points, polyline_points, simplify_mask
 
 # Configure basic logger
 logging.basicConfig(
@@ -27,16 +31,68 @@ except ImportError:
     logger.error("characters_data.py not found. Please ensure it exists in the same directory.")
     CHARACTERS = {}
 
+# (cos, sin) of the axis-aligned angles used for spacing, underlines and debug marks
+_CARDINAL_DIRECTIONS: Dict[float, Tuple[float, float]] = {
+    0: (1.0, 0.0),
+    90: (0.0, 1.0),
+    180: (-1.0, 0.0),
+    270: (0.0, -1.0),
+}
+
+# Per-character path arrays and bounds, built on first use by _get_character.
+# Entries are not refreshed when CHARACTERS changes; use _clear_caches() for that.
+_CHARACTER_CACHE: Dict[str, Optional[dict]] = {}
+
+
+def _get_character(character: str) -> Optional[dict]:
+    """
+    Returns the cached definition of a character.
+
+    Args:
+        character (str): The character to look up.
+
+    Returns:
+        Optional[dict]: A dictionary containing 'path' as an (N, 2) array, 'width',
+        'start_offset', 'min_y' and 'max_y', or None if the character is not defined.
+    """
+    if character not in _CHARACTER_CACHE:
+        char_data = CHARACTERS.get(character)
+        if char_data is None:
+            _CHARACTER_CACHE[character] = None
+        else:
+            path = np.asarray(char_data['path'], dtype=np.float64).reshape(-1, 2)
+            _CHARACTER_CACHE[character] = {
+                'path': path,
+                'width': char_data.get('width', 1.0),
+                'start_offset': char_data.get('start_offset', 0),
+                'min_y': float(path[:, 1].min()) if len(path) else 0.0,
+                'max_y': float(path[:, 1].max()) if len(path) else 0.0,
+            }
+    return _CHARACTER_CACHE[character]
+
+
+def _clear_caches() -> None:
+    """Discards the cached character data; call after modifying CHARACTERS at runtime."""
+    _CHARACTER_CACHE.clear()
+
 
 class SandSkrit:
     """
     Main class for generating continuous polylines.
 
+    Points are stored in a growable (N, 2) float64 array; only the first
+    ``_n`` rows are part of the path.
+
     Attributes:
-        points (List[Tuple[float, float]]): A list of (x, y) coordinates representing the path.
+        points (List[Tuple[float, float]]): A copy of the path as (x, y) tuples. Building it
+            costs O(N) per access, and changing the returned list does not change the path;
+            assign a new sequence to replace the path.
+        points_array (np.ndarray): Read-only (N, 2) view of the path, without copying.
     """
 
-    def __init__(self, x: float = 0, y: float = 0):
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, x: float = 0, y: float = 0) -> None:
         """
         Initializes SandSkrit with an optional starting point.
 
@@ -44,7 +100,56 @@ class SandSkrit:
             x (float): Starting x-coordinate. Defaults to 0.
             y (float): Starting y-coordinate. Defaults to 0.
         """
-        self.points: List[Tuple[float, float]] = [(float(x), float(y))]
+        self._xy = np.empty((self.INITIAL_CAPACITY, 2), dtype=np.float64)
+        self._xy[0] = (float(x), float(y))
+        self._n = 1
+
+    @property
+    def points(self) -> List[Tuple[float, float]]:
+        """The path as a newly built list of (x, y) tuples."""
+        return [tuple(point) for point in self._xy[:self._n].tolist()]
+
+    @points.setter
+    def points(self, points: List[Tuple[float, float]]) -> None:
+        """
+        Replaces the path with the given points.
+
+        Args:
+            points (List[Tuple[float, float]]): The new (x, y) coordinates, stored as given.
+
+        Raises:
+            ValueError: If no points are given.
+        """
+        xy = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if len(xy) == 0:
+            raise ValueError("A path needs at least one point")
+        self._xy = np.empty((max(self.INITIAL_CAPACITY, len(xy)), 2), dtype=np.float64)
+        self._xy[:len(xy)] = xy
+        self._n = len(xy)
+
+    @property
+    def points_array(self) -> np.ndarray:
+        """The path as a read-only (N, 2) array view of the point storage."""
+        view = self._xy[:self._n]
+        view.flags.writeable = False
+        return view
+
+    def _reserve(self, count: int) -> None:
+        """
+        Grows the point storage so that it can hold at least count more points.
+
+        Args:
+            count (int): Number of points about to be added.
+        """
+        needed = self._n + count
+        capacity = len(self._xy)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        grown = np.empty((capacity, 2), dtype=np.float64)
+        grown[:self._n] = self._xy[:self._n]
+        self._xy = grown
 
     def add_point(self, x: float, y: float) -> None:
         """
@@ -54,98 +159,146 @@ class SandSkrit:
             x (float): x-coordinate.
             y (float): y-coordinate.
         """
-        rounded_x = round(float(x), 3)
-        rounded_y = round(float(y), 3)
-        if self.points and (rounded_x, rounded_y) == self.points[-1]:
+        # np.round rather than round() so single points round exactly like batches
+        rounded_x = float(np.round(float(x), 3))
+        rounded_y = float(np.round(float(y), 3))
+        last_x, last_y = self._xy[self._n - 1]
+        if rounded_x == last_x and rounded_y == last_y:
+            return
+        self._reserve(1)
+        self._xy[self._n] = (rounded_x, rounded_y)
+        self._n += 1
+        logger.debug("Added point: (%s, %s)", rounded_x, rounded_y)
+
+    def _extend_points(self, points: np.ndarray) -> None:
+        """
+        Adds a batch of points to the path, avoiding duplicates like add_point.
+
+        Args:
+            points (np.ndarray): Array of shape (N, 2) holding (x, y) coordinates.
+        """
+        if len(points) == 0:
             return
-        self.points.append((rounded_x, rounded_y))
-        logger.debug(f"Added point: ({rounded_x}, {rounded_y})")
+        rounded = np.round(points, 3)
+        # A point is kept if it differs from its predecessor, starting with the current last point
+        keep = np.diff(np.vstack((self._xy[self._n - 1], rounded)), axis=0).any(axis=1)
+        kept = rounded[keep]
+        self._reserve(len(kept))
+        self._xy[self._n:self._n + len(kept)] = kept
+        self._n += len(kept)
 
     def get_current_point(self) -> Tuple[float, float]:
         """Returns the most recently added point."""
-        return self.points[-1]
+        return tuple(self._xy[self._n - 1].tolist())
+
+    @staticmethod
+    def _svg_coordinates(path: np.ndarray) -> Tuple[float, ...]:
+        """
+        Shifts a path so its bounding box starts at (0, 0) and flattens it for formatting.
+
+        Args:
+            path (np.ndarray): Array of shape (N, 2) holding (x, y) coordinates.
+
+        Returns:
+            Tuple[float, ...]: The shifted coordinates as x0, y0, x1, y1, ...
+        """
+        relative = path - path.min(axis=0)
+        return tuple(relative.ravel().tolist())
 
     def _to_svg_polyline(self) -> str:
         """Generates an SVG <polyline> element for the current path."""
-        if not self.points:
+        if self._n == 0:
             return ""
-        min_x = min(p[0] for p in self.points)
-        min_y = min(p[1] for p in self.points)
-        points_str = " ".join([f"{x - min_x:.3f},{y - min_y:.3f}" for x, y in self.points])
+        # Format every coordinate with a single %-operation instead of one f-string per point
+        points_str = " ".join(["%.3f,%.3f"] * self._n) % self._svg_coordinates(self.points_array)
         return f'<polyline points="{points_str}" fill="none" stroke="black" stroke-width="0.5" />'
 
-    def _to_svg_path(self) -> str:
-        """Generates an SVG path data string (d attribute) for the current path."""
-        if not self.points:
+    def _to_svg_path(self, epsilon: float = 0.0) -> str:
+        """
+        Generates an SVG path data string (d attribute) for the current path.
+
+        Args:
+            epsilon (float): Douglas-Peucker tolerance for dropping vertices. Defaults to 0.0 (keep all).
+
+        Returns:
+            str: SVG path data.
+        """
+        if self._n == 0:
             return ""
-        min_x = min(p[0] for p in self.points)
-        min_y = min(p[1] for p in self.points)
-        d = f"M {self.points[0][0] - min_x:.3f} {self.points[0][1] - min_y:.3f}"
-        for x, y in self.points[1:]:
-            d += f" L {x - min_x:.3f} {y - min_y:.3f}"
-        return d
+        path = self.points_array
+        if epsilon > 0:
+            path = path[simplify_mask(path, epsilon)]
+        template = "M %.3f %.3f" + " L %.3f %.3f" * (len(path) - 1)
+        return template % self._svg_coordinates(path)
 
-    def _to_thr(self, extra_radius: float = 1.0) -> str:
+    def _to_thr(self, extra_radius: float = 1.0, epsilon: float = 0.0) -> str:
         """
         Converts points to THR format (theta, rho).
 
+        Sand tables interpolate linearly in theta and rho, not in x and y, so
+        simplification is done on the (theta, rho) polyline.
+
         Args:
             extra_radius (float): Added to max radius for normalization. Defaults to 1.0.
+            epsilon (float): Douglas-Peucker tolerance in (theta, rho) space. Defaults to 0.0 (keep all).
 
         Returns:
             str: THR file content.
         """
-        if not self.points:
+        if self._n == 0:
             return ""
+        path = self.points_array
+        xs = path[:, 0]
+        ys = path[:, 1]
 
         # Normalize rho to [0, 1] based on maximum distance from origin
-        max_dist = max(math.sqrt(x**2 + y**2) for x, y in self.points) + extra_radius
+        distances = np.hypot(xs, ys)
+        max_dist = distances.max() + extra_radius
         max_rho = max_dist if max_dist > 0 else 1.0
-
-        thr_lines = []
-        last_theta = 0.0
-
-        for i, (x, y) in enumerate(self.points):
-            rho = math.sqrt(x**2 + y**2) / max_rho
-            
-            # Use atan2(x, -y) to match sand table coordinate system (90 deg CCW rotation)
-            theta = math.atan2(x, -y)
-
-            if i > 0:
-                # Ensure theta is cumulative (avoids jumps at -pi/pi)
-                delta = theta - (last_theta % (2 * math.pi))
-                if delta > math.pi:
-                    delta -= 2 * math.pi
-                elif delta < -math.pi:
-                    delta += 2 * math.pi
-                theta = last_theta + delta
-
-            thr_lines.append(f"{theta:.5f} {rho:.5f}")
-            last_theta = theta
-
-        return "\n".join(thr_lines)
-
-    def save_thr(self, filename: str) -> None:
+        rhos = distances / max_rho
+
+        # Use atan2(x, -y) to match sand table coordinate system (90 deg CCW rotation)
+        raw_thetas = np.arctan2(xs, -ys)
+
+        # Ensure theta is cumulative (avoids jumps at -pi/pi) by wrapping each
+        # step into [-pi, pi] with rounding instead of comparisons
+        two_pi = 2 * math.pi
+        deltas = np.diff(raw_thetas)
+        deltas -= two_pi * np.round(deltas / two_pi)
+        thetas = np.empty_like(raw_thetas)
+        thetas[0] = raw_thetas[0]
+        np.cumsum(deltas, out=thetas[1:])
+        thetas[1:] += raw_thetas[0]
+
+        thr_points = np.column_stack((thetas, rhos))
+        if epsilon > 0:
+            thr_points = thr_points[simplify_mask(thr_points, epsilon)]
+        template = "\n".join(["%.5f %.5f"] * len(thr_points))
+        return template % tuple(thr_points.ravel().tolist())
+
+    def save_thr(self, filename: str, epsilon: float = 0.0) -> None:
         """
         Saves the path to a THR file.
 
         Args:
             filename (str): Path to the output THR file.
+            epsilon (float): Douglas-Peucker tolerance in (theta, rho) space. Defaults to 0.0 (keep all).
         """
-        thr_content = self._to_thr()
+        thr_content = self._to_thr(epsilon=epsilon)
         with open(filename, "w") as f:
             f.write(thr_content)
         logger.info(f"Saved THR to {filename}")
 
-    def save_svg(self, filename: str, size: int = 200) -> None:
+    def save_svg(self, filename: str, size: int = 200, epsilon: float = 0.05) -> None:
         """
         Saves the path to an SVG file.
 
         Args:
             filename (str): Path to the output SVG file.
             size (int): Viewbox size for the SVG. Defaults to 200.
+            epsilon (float): Douglas-Peucker tolerance for dropping vertices. Defaults to 0.05.
         """
-        d = self._to_svg_path()
+        d = self._to_svg_path(epsilon)
         svg_content = f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {size} {size}">
   <path d="{d}" fill="none" stroke="black" stroke-width="0.5" stroke-linejoin="round" stroke-linecap="round" />
 </svg>'''
@@ -172,14 +325,18 @@ class SandSkrit:
         for char in text:
             if char == " ":
                 total_width += 0.5 * scale
-            elif char in CHARACTERS and CHARACTERS[char] is not None:
-                char_data = CHARACTERS[char]
-                total_width += (char_data.get('width', 1.0) + 2 * character_spacing) * scale
-                for pt in char_data['path']:
-                    min_y = min(min_y, pt[1] * scale)
-                    max_y = max(max_y, pt[1] * scale)
-            else:
+                continue
+
+            char_data = _get_character(char)
+            if char_data is None:
                 logger.warning(f"Character '{char}' not supported, skipping for metrics calculation")
+                continue
+
+            total_width += (char_data['width'] + 2 * character_spacing) * scale
+            scaled_min_y = char_data['min_y'] * scale
+            scaled_max_y = char_data['max_y'] * scale
+            min_y = min(min_y, scaled_min_y, scaled_max_y)
+            max_y = max(max_y, scaled_min_y, scaled_max_y)
 
         return {
             'width': total_width,
@@ -187,7 +344,7 @@ class SandSkrit:
             'max_y': max_y
         }
 
-    def add_lines_of_text(self, lines_config: list, line_spacing: float = 1.4):
+    def add_lines_of_text(self, lines_config: List[dict], line_spacing: float = 1.4) -> None:
         """
         Adds multiple lines of text centered vertically and horizontally.
         Checks if each line fits within the circle boundary and throws an exception if not.
@@ -197,57 +354,62 @@ class SandSkrit:
             line_spacing (float): Multiplier for scale to determine vertical distance between lines.
         """
         initial_point = self.get_current_point()
-        initial_radius = math.sqrt(initial_point[0]**2 + initial_point[1]**2)
+        initial_radius = math.hypot(initial_point[0], initial_point[1])
 
-        # Calculate line heights and total height
-        line_heights = []
+        # Resolve each line's settings and measure its text once; the results are
+        # shared by the layout, the fit check and the drawing below
+        lines = []
         for config in lines_config:
+            text = config.get('text', '')
             scale = config.get('scale', 5.0)
             offset_up = config.get('offset_up', 0.9)
-            line_heights.append(scale * line_spacing + offset_up)
+            character_spacing = config.get('character_spacing', 0.1)
+            lines.append({
+                'text': text,
+                'scale': scale,
+                'offset_up': offset_up,
+                'character_spacing': character_spacing,
+                'debug': config.get('debug', False),
+                'height': scale * line_spacing + offset_up,
+                'metrics': self.get_text_metrics(text, scale, character_spacing),
+            })
+
+        total_text_height = sum(line['height'] for line in lines)
 
-        total_text_height = sum(line_heights)
-        
         # Calculate vertical offsets to center the block of text
         vertical_offsets = []
         current_offset = -total_text_height / 2
-        for i, height in enumerate(line_heights):
+        for line in lines:
             # The baseline should be positioned such that the entire line 
             # (including offset_up) is within the height allocated.
             # Since offset_up pushes the character DOWN, the baseline is at the TOP of the height.
-            offset_up = lines_config[i].get('offset_up', 0.9)
-            vertical_offsets.append(current_offset + height - offset_up)
-            current_offset += height
+            vertical_offsets.append(current_offset + line['height'] - line['offset_up'])
+            current_offset += line['height']
 
         # Pre-check: Verify if all lines fit within the boundary
-        for i, config in enumerate(lines_config):
-            v_offset = vertical_offsets[i]
-            text = config.get('text', '')
-            scale = config.get('scale', 5.0)
-            offset_up = config.get('offset_up', 0.9)
-            char_spacing = config.get('character_spacing', 0.1)
-
-            metrics = self.get_text_metrics(text, scale, char_spacing)
+        max_distance = initial_radius + 0.001
+        max_distance_sq = max_distance * max_distance
+        for line, v_offset in zip(lines, vertical_offsets):
+            metrics = line['metrics']
             half_width = metrics['width'] / 2
 
             # path_start_y is the y-coordinate where character paths begin relative to baseline
-            path_start_y = v_offset - scale * offset_up
+            path_start_y = v_offset - line['scale'] * line['offset_up']
             y_min = min(v_offset, path_start_y + metrics['min_y'])
             y_max = max(v_offset, path_start_y + metrics['max_y'])
 
-            # Check four corners of the bounding box against circle radius
-            for x in [-half_width, half_width]:
-                for y in [y_min, y_max]:
-                    if x*x + y*y > (initial_radius + 0.001)**2:
-                        raise ValueError(
-                            f"Line '{text}' does not fit in circle of radius {initial_radius:.2f}. "
-                            f"Point ({x:.2f}, {y:.2f}) is at distance {math.sqrt(x*x+y*y):.2f}"
-                        )
+            # The box is centered horizontally, so its farthest corner from the
+            # center decides whether it fits in the circle
+            x = -half_width
+            y = y_min if abs(y_min) >= abs(y_max) else y_max
+            if x*x + y*y > max_distance_sq:
+                raise ValueError(
+                    f"Line '{line['text']}' does not fit in circle of radius {initial_radius:.2f}. "
+                    f"Point ({x:.2f}, {y:.2f}) is at distance {math.hypot(x, y):.2f}"
+                )
 
         # Draw each line
-        for i, config in enumerate(lines_config):
-            v_offset = vertical_offsets[i]
-            
+        for line, v_offset in zip(lines, vertical_offsets):
             # Find starting angle on the circle at y = v_offset
             if abs(v_offset) < initial_radius:
                 angle_offset = math.degrees(math.asin(v_offset / initial_radius))
@@ -260,13 +422,14 @@ class SandSkrit:
             self.add_outer_loop(turns=0, ending_angle=start_angle)
 
             # Draw the line of text
-            self.add_line_of_text(
-                text=config.get('text', ''),
-                scale=config.get('scale', 5.0),
-                offset_up=config.get('offset_up', 0.9),
-                character_spacing=config.get('character_spacing', 0.1),
-                debug=config.get('debug', False),
-                vertical_offset=0.0
+            self._add_line_of_text(
+                text=line['text'],
+                scale=line['scale'],
+                offset_up=line['offset_up'],
+                character_spacing=line['character_spacing'],
+                debug=line['debug'],
+                vertical_offset=0.0,
+                text_width=line['metrics']['width']
             )
 
     def add_line_of_text(self, text: str, scale: float = 5.0, offset_up: float = 0.9,
@@ -283,6 +446,23 @@ class SandSkrit:
             debug (bool): If True, adds debug markings. Defaults to False.
             vertical_offset (float): Optional vertical shift. Defaults to 0.0.
         """
+        metrics = self.get_text_metrics(text, scale, character_spacing)
+        self._add_line_of_text(text, scale, offset_up, character_spacing, debug, vertical_offset, metrics['width'])
+
+    def _add_line_of_text(self, text: str, scale: float, offset_up: float, character_spacing: float,
+                          debug: bool, vertical_offset: float, text_width: float) -> None:
+        """
+        Implements add_line_of_text for a text whose width has already been measured.
+
+        Args:
+            text (str): Text to add.
+            scale (float): Scaling factor.
+            offset_up (float): Vertical offset for the path.
+            character_spacing (float): Space between characters.
+            debug (bool): If True, adds debug markings.
+            vertical_offset (float): Optional vertical shift.
+            text_width (float): Width of the text as returned by get_text_metrics.
+        """
         initial_point = self.get_current_point()
         initial_x, initial_y = initial_point
 
@@ -293,8 +473,7 @@ class SandSkrit:
         # The line length is twice the distance from x=0, forming a chord
         line_length = abs(initial_x) * 2
 
-        metrics = self.get_text_metrics(text, scale, character_spacing)
-        excess_length = line_length - metrics['width']
+        excess_length = line_length - text_width
         
         # Start from left (negative x) or right (positive x)
         angle = 0 if initial_x < 0 else 180
@@ -348,7 +527,7 @@ class SandSkrit:
         if character not in CHARACTERS:
             raise ValueError(f"Character '{character}' not supported")
         
-        char_data = CHARACTERS[character]
+        char_data = _get_character(character)
         if char_data is None:
             raise ValueError(f"Character '{character}' has not been defined")
 
@@ -362,9 +541,9 @@ class SandSkrit:
             self._add_debug_mark(2)
 
         # Handle start offset if present
-        start_offset = char_data.get('start_offset', 0)
+        start_offset = char_data['start_offset']
         if start_offset:
-            logger.debug(f"Adding character '{character}' with start offset: {start_offset}")
+            logger.debug("Adding character '%s' with start offset: %s", character, start_offset)
             # Move horizontally by start_offset * scale
             self.add_line(length=abs(start_offset) * scale, angle=0 if start_offset < 0 else 180)
 
@@ -376,18 +555,13 @@ class SandSkrit:
         
         initial_position = self.get_current_point()
 
-        # Draw character path
-        for point in char_data['path']:
-            target_x = initial_position[0] + point[0] * scale
-            target_y = initial_position[1] + point[1] * scale
-            current_x, current_y = self.get_current_point()
-            
-            dx = target_x - current_x
-            dy = target_y - current_y
-            
-            dist = math.sqrt(dx**2 + dy**2)
-            angle = math.degrees(math.atan2(dy, dx))
-            self.add_line(length=dist, angle=angle)
+        # Draw character path as one polyline, subdivided like add_line. Targets are
+        # rounded so each stroke starts exactly where the previous one was stored;
+        # the segment count of a stroke is therefore taken from its length between
+        # rounded endpoints, and can differ by one from measuring to the exact target.
+        targets = np.round(char_data['path'] * scale + initial_position, 3)
+        anchors = np.vstack((initial_position, targets))
+        self._extend_points(polyline_points(anchors, 1.0))
 
         # Move back up to baseline
         self.add_line(length=offset_up, angle=90)
@@ -423,22 +597,68 @@ class SandSkrit:
             max_length (float): Maximum length of each segment. Defaults to 1.0.
         """
         last_x, last_y = self.get_current_point()
-        angle_rad = math.radians(angle)
         num_segments = math.ceil(abs(length) / max_length)
         if num_segments == 0:
             return
 
+        direction = _CARDINAL_DIRECTIONS.get(angle)
+        if direction is None:
+            angle_rad = math.radians(angle)
+            direction = (math.cos(angle_rad), math.sin(angle_rad))
+        cos_angle, sin_angle = direction
+
         if length < 0:
-            angle_rad += math.pi
+            cos_angle, sin_angle = -cos_angle, -sin_angle
             length = abs(length)
 
         segment_length = length / num_segments
-        logger.debug(f"Generating line of length {length} at {angle} degrees with {num_segments} segments")
+        logger.debug("Generating line of length %s at %s degrees with %s segments", length, angle, num_segments)
 
-        for i in range(1, num_segments + 1):
-            x = last_x + (segment_length * i) * math.cos(angle_rad)
-            y = last_y + (segment_length * i) * math.sin(angle_rad)
-            self.add_point(x, y)
+        if max_length == 1.0 and angle in _CARDINAL_DIRECTIONS:
+            if sin_angle == 0:
+                self._add_axis_line(0, last_x, last_y, segment_length * cos_angle, num_segments)
+            else:
+                self._add_axis_line(1, last_y, last_x, segment_length * sin_angle, num_segments)
+            return
+
+        self._extend_points(line_points(last_x, last_y, segment_length, cos_angle, sin_angle, num_segments))
+
+    def _add_axis_line(self, axis: int, start: float, fixed: float, step: float, num_segments: int) -> None:
+        """
+        Fast path of add_line for lines parallel to the x or y axis.
+
+        Segments of a line with a maximum segment length of 1.0 are either longer
+        than 0.5 or there is only one, so only the first point can duplicate the
+        current point and the full duplicate check is skipped.
+
+        Args:
+            axis (int): Index of the coordinate that changes (0 for x, 1 for y).
+            start (float): Current value of the changing coordinate.
+            fixed (float): Value of the coordinate that stays constant.
+            step (float): Signed length of each segment.
+            num_segments (int): Number of segments.
+
+        Both coordinates are rounded, even when the line starts at an unrounded point:
+
+        >>> path = SandSkrit(0, 0.12345)
+        >>> path.add_line(length=2, angle=0)
+        >>> path.points
+        [(0.0, 0.12345), (1.0, 0.123), (2.0, 0.123)]
+        >>> path = SandSkrit(0.12345, 0)
+        >>> path.add_line(length=0.0001, angle=90)
+        >>> path.points
+        [(0.12345, 0.0), (0.123, 0.0)]
+        """
+        coords = np.round(start + np.arange(1, num_segments + 1) * step, 3)
+        rounded_fixed = float(np.round(fixed, 3))
+        if coords[0] == start and rounded_fixed == fixed:
+            coords = coords[1:]
+        count = len(coords)
+        self._reserve(count)
+        block = self._xy[self._n:self._n + count]
+        block[:, axis] = coords
+        block[:, 1 - axis] = rounded_fixed
+        self._n += count
 
     def add_spiral_out(self, radius: float = 98.0, turns: float = 8.0, ending_angle: float = 180.0) -> None:
         """
@@ -448,16 +668,15 @@ class SandSkrit:
             radius (float): Final radius of the spiral. Defaults to 98.0.
             turns (float): Number of full rotations. Defaults to 8.0.
             ending_angle (float): Final angle in degrees. Defaults to 180.0.
+
+        Raises:
+            ValueError: If turns and ending_angle add up to zero degrees.
         """
-        logger.debug(f"Generating spiral out: radius={radius}, turns={turns}, end_angle={ending_angle}")
+        logger.debug("Generating spiral out: radius=%s, turns=%s, end_angle=%s", radius, turns, ending_angle)
         total_degrees = turns * 360 + ending_angle
-        
-        for i in range(int(total_degrees) + 1):
-            angle_rad = math.radians(i)
-            current_radius = radius * (i / total_degrees)
-            x = current_radius * math.cos(angle_rad)
-            y = current_radius * math.sin(angle_rad)
-            self.add_point(x, y)
+        if total_degrees == 0:
+            raise ValueError("Spiral out must span a non-zero angle (turns * 360 + ending_angle == 0)")
+        self._extend_points(spiral_points(radius, total_degrees, True))
 
     def add_spiral_in(self, turns: float = 8.0) -> None:
         """
@@ -465,20 +684,19 @@ class SandSkrit:
 
         Args:
             turns (float): Number of full rotations. Defaults to 8.0.
+
+        Raises:
+            ValueError: If turns and the current angle add up to zero degrees.
         """
         last_x, last_y = self.get_current_point()
-        radius = math.sqrt(last_x**2 + last_y**2)
+        radius = math.hypot(last_x, last_y)
         start_angle_deg = math.degrees(math.atan2(last_y, last_x))
         
-        logger.debug(f"Generating spiral in: radius={radius:.2f}, turns={turns}, start_angle={start_angle_deg:.2f}")
+        logger.debug("Generating spiral in: radius=%.2f, turns=%s, start_angle=%.2f", radius, turns, start_angle_deg)
         total_degrees = turns * 360 + start_angle_deg
-        
-        for i in range(int(total_degrees), -1, -1):
-            angle_rad = math.radians(i)
-            current_radius = radius * (i / total_degrees)
-            x = current_radius * math.cos(angle_rad)
-            y = current_radius * math.sin(angle_rad)
-            self.add_point(x, y)
+        if total_degrees == 0:
+            raise ValueError("Spiral in must span a non-zero angle (turns * 360 + current angle == 0)")
+        self._extend_points(spiral_points(radius, total_degrees, False))
 
     def add_outer_loop(self, turns: float = 2.0, ending_angle: float = 0.0) -> None:
         """
@@ -489,22 +707,18 @@ class SandSkrit:
             ending_angle (float): Final angle in degrees. Defaults to 0.0.
         """
         last_x, last_y = self.get_current_point()
-        radius = math.sqrt(last_x**2 + last_y**2)
+        radius = math.hypot(last_x, last_y)
         start_angle_deg = math.degrees(math.atan2(last_y, last_x))
         
-        logger.debug(f"Starting outer loop: radius={radius:.2f}, start_angle={start_angle_deg:.2f}")
+        logger.debug("Starting outer loop: radius=%.2f, start_angle=%.2f", radius, start_angle_deg)
 
         # Calculate total degrees to move
         angle_diff = (ending_angle - start_angle_deg) % 360
         total_degrees = turns * 360 + angle_diff
         
-        for i in range(1, int(total_degrees) + 1):
-            angle_rad = math.radians(start_angle_deg + i)
-            x = radius * math.cos(angle_rad)
-            y = radius * math.sin(angle_rad)
-            self.add_point(x, y)
+        self._extend_points(circle_points(radius, start_angle_deg, int(total_degrees)))
 
-        logger.debug(f"Outer loop finished at: {self.get_current_point()}")
+        logger.debug("Outer loop finished at: %s", self.get_current_point())
 
 
 
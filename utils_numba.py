@@ -0,0 +1,170 @@
+"""
+Point generation kernels for SandSkrit.
+
+Each kernel returns an (N, 2) array of unrounded (x, y) points. When numba is
+installed the kernels are JIT-compiled; otherwise they run as plain NumPy.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Cosine and sine of every whole degree, indexed by degree % 360
+_DEGREE_COS = np.cos(np.deg2rad(np.arange(360, dtype=np.float64)))
+_DEGREE_SIN = np.sin(np.deg2rad(np.arange(360, dtype=np.float64)))
+
+
+@njit(cache=True)
+def line_points(x: float, y: float, segment_length: float, cos_angle: float, sin_angle: float,
+                num_segments: int) -> np.ndarray:
+    """
+    Generates the segment endpoints of a straight line.
+
+    Args:
+        x (float): Starting x-coordinate (not included in the output).
+        y (float): Starting y-coordinate (not included in the output).
+        segment_length (float): Length of each segment.
+        cos_angle (float): Cosine of the line direction.
+        sin_angle (float): Sine of the line direction.
+        num_segments (int): Number of segments.
+
+    Returns:
+        np.ndarray: Array of shape (num_segments, 2).
+    """
+    steps = np.arange(1, num_segments + 1) * segment_length
+    out = np.empty((num_segments, 2))
+    out[:, 0] = x + steps * cos_angle
+    out[:, 1] = y + steps * sin_angle
+    return out
+
+
+@njit(cache=True)
+def spiral_points(radius: float, total_degrees: float, outward: bool) -> np.ndarray:
+    """
+    Generates one point per degree of an Archimedean spiral centered on the origin.
+
+    Args:
+        radius (float): Radius reached at total_degrees.
+        total_degrees (float): Angle in degrees at which the spiral reaches radius.
+        outward (bool): If True, runs from the origin outwards, otherwise inwards.
+
+    Returns:
+        np.ndarray: Array of shape (int(total_degrees) + 1, 2).
+    """
+    if outward:
+        steps = np.arange(0, int(total_degrees) + 1)
+    else:
+        steps = np.arange(int(total_degrees), -1, -1)
+    lut_index = steps % 360
+    radii = radius * (steps.astype(np.float64) / total_degrees)
+    out = np.empty((len(steps), 2))
+    out[:, 0] = radii * _DEGREE_COS[lut_index]
+    out[:, 1] = radii * _DEGREE_SIN[lut_index]
+    return out
+
+
+@njit(cache=True)
+def circle_points(radius: float, start_angle_deg: float, num_degrees: int) -> np.ndarray:
+    """
+    Generates one point per degree along a circle centered on the origin.
+
+    Args:
+        radius (float): Radius of the circle.
+        start_angle_deg (float): Starting angle in degrees (not included in the output).
+        num_degrees (int): Number of degrees to travel counter-clockwise.
+
+    Returns:
+        np.ndarray: Array of shape (num_degrees, 2).
+    """
+    # Rotate the whole-degree table by the starting angle instead of evaluating trig per point
+    start_rad = np.deg2rad(start_angle_deg)
+    start_cos = radius * np.cos(start_rad)
+    start_sin = radius * np.sin(start_rad)
+    lut_index = np.arange(1, num_degrees + 1) % 360
+    step_cos = _DEGREE_COS[lut_index]
+    step_sin = _DEGREE_SIN[lut_index]
+    out = np.empty((num_degrees, 2))
+    out[:, 0] = start_cos * step_cos - start_sin * step_sin
+    out[:, 1] = start_sin * step_cos + start_cos * step_sin
+    return out
+
+
+@njit(cache=True)
+def polyline_points(anchors: np.ndarray, max_length: float) -> np.ndarray:
+    """
+    Subdivides a polyline so that no segment is longer than max_length.
+
+    Args:
+        anchors (np.ndarray): Array of shape (M, 2) holding the polyline vertices.
+        max_length (float): Maximum length of each segment.
+
+    Returns:
+        np.ndarray: Array of shape (N, 2) with the subdivided points, excluding
+        the first anchor. Zero-length edges contribute no points.
+    """
+    deltas = anchors[1:] - anchors[:-1]
+    counts = np.ceil(np.hypot(deltas[:, 0], deltas[:, 1]) / max_length).astype(np.int64)
+    out = np.empty((counts.sum(), 2))
+    edges = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    fractions = (np.arange(len(out)) - offsets + 1) / counts[edges]
+    out[:, 0] = anchors[edges, 0] + deltas[edges, 0] * fractions
+    out[:, 1] = anchors[edges, 1] + deltas[edges, 1] * fractions
+    return out
+
+
+@njit(cache=True)
+def simplify_mask(points: np.ndarray, epsilon: float) -> np.ndarray:
+    """
+    Selects the vertices kept by Douglas-Peucker simplification.
+
+    Distances are measured to the segment between the kept endpoints rather
+    than to the infinite line, so paths that retrace themselves keep their
+    turning points. Each range is measured with array operations, which keeps
+    the plain NumPy fallback fast as well.
+
+    Args:
+        points (np.ndarray): Array of shape (N, 2) holding the polyline vertices.
+        epsilon (float): Maximum distance a removed vertex may lie from the simplified polyline.
+
+    Returns:
+        np.ndarray: Boolean mask of length N, True for kept vertices.
+    """
+    keep = np.ones(len(points), dtype=np.bool_)
+    if len(points) < 3:
+        return keep
+    keep[1:-1] = False
+    stack = [(0, len(points) - 1)]
+    while len(stack) > 0:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        x0 = points[start, 0]
+        y0 = points[start, 1]
+        dx = points[end, 0] - x0
+        dy = points[end, 1] - y0
+        offsets_x = points[start + 1:end, 0] - x0
+        offsets_y = points[start + 1:end, 1] - y0
+        length_sq = dx * dx + dy * dy
+        if length_sq > 0:
+            t = np.minimum(np.maximum((offsets_x * dx + offsets_y * dy) / length_sq, 0.0), 1.0)
+            offsets_x = offsets_x - t * dx
+            offsets_y = offsets_y - t * dy
+        distances = np.hypot(offsets_x, offsets_y)
+        index = int(np.argmax(distances))
+        if distances[index] > epsilon:
+            split = start + 1 + index
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return keep